@@ -0,0 +1,64 @@
+# Copyright (c) 2021-2022, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pathlib
+from typing import Optional
+
+import fire
+import tensorflow as tf  # pytype: disable=import-error
+from tf2onnx import tf_loader  # pytype: disable=import-error
+from tf2onnx.convert import _convert_common  # pytype: disable=import-error
+
+
+def convert(
+    exported_model_path: str,
+    converted_model_path: str,
+    opset: int,
+    navigator_workdir: Optional[str] = None,
+):
+
+    if not navigator_workdir:
+        navigator_workdir = pathlib.Path.cwd()
+    navigator_workdir = pathlib.Path(navigator_workdir)
+
+    exported_model_path = pathlib.Path(exported_model_path)
+    if not exported_model_path.is_absolute():
+        exported_model_path = navigator_workdir / exported_model_path
+
+    converted_model_path = pathlib.Path(converted_model_path)
+    if not converted_model_path.is_absolute():
+        converted_model_path = navigator_workdir / converted_model_path
+
+    graph_def, inputs, outputs, initialized_tables, tensors_to_rename = tf_loader.from_saved_model(
+        exported_model_path.as_posix(),
+        None,
+        None,
+        return_initialized_tables=True,
+        return_tensors_to_rename=True,
+    )
+
+    with tf.device("/cpu:0"):
+        _convert_common(
+            graph_def,
+            name=exported_model_path.as_posix(),
+            opset=opset,
+            input_names=inputs,
+            output_names=outputs,
+            tensors_to_rename=tensors_to_rename,
+            initialized_tables=initialized_tables,
+            output_path=converted_model_path.as_posix(),
+        )
+
+
+if __name__ == "__main__":
+    fire.Fire(convert)
@@ -97,7 +97,7 @@ class ConvertTorchScript2TorchTensorRT(ConvertBase):
                 "debug": debug,
             }
 
-            args = parse_kwargs_to_cmd(kwargs, (list, dict, tuple))
+            args = parse_kwargs_to_cmd(kwargs)
 
             context.execute_external_runtime_script(ts2torchtrt.__file__, args)
 
@@ -65,25 +65,26 @@ class ConvertSavedModel2ONNX(ConvertBase):
             LOGGER.warning(f"Exported SavedModel model not found at {exported_model_path}. Skipping conversion")
             self.status = Status.SKIPPED
             return
-
-        convert_cmd = [
-            "python",
-            "-m",
-            "tf2onnx.convert",
-            "--saved-model",
-            exported_model_path.relative_to(workdir).as_posix(),
-            "--output",
-            converted_model_path.relative_to(workdir).as_posix(),
-            "--opset",
-            str(opset),
-        ]
+        converted_model_path.parent.mkdir(parents=True, exist_ok=True)
 
         with ExecutionContext(
             workdir=workdir,
+            script_path=converted_model_path.parent / "reproduce_conversion.py",
             cmd_path=converted_model_path.parent / "reproduce_conversion.sh",
             verbose=verbose,
         ) as context:
-            context.execute_cmd(convert_cmd)
+            kwargs = {
+                "exported_model_path": exported_model_path.relative_to(workdir).as_posix(),
+                "converted_model_path": converted_model_path.relative_to(workdir).as_posix(),
+                "opset": opset,
+                "navigator_workdir": workdir.as_posix(),
+            }
+
+            args = parse_kwargs_to_cmd(kwargs)
+
+            from model_navigator.framework_api.commands.convert.converters import sm2onnx
+
+            context.execute_local_runtime_script(sm2onnx.__file__, sm2onnx.convert, args)
 
         return self.get_output_relative_path()
 
@@ -154,8 +155,8 @@ class ConvertSavedModel2TFTRT(ConvertBase):
                 "navigator_workdir": workdir.as_posix(),
             }
 
-            args = parse_kwargs_to_cmd(kwargs, (list, dict, tuple))
+            args = parse_kwargs_to_cmd(kwargs)
 
-            context.execute_external_runtime_script(sm2tftrt.__file__, args)
+            context.execute_local_runtime_script(sm2tftrt.__file__, sm2tftrt.convert, args)
 
         return self.get_output_relative_path()
@@ -153,7 +153,7 @@ class Correctness(Command):
                 "runner_manager_dict": runner_manager.to_dict(parse=True),
             }
 
-            args = parse_kwargs_to_cmd(kwargs, (list, dict, tuple))
+            args = parse_kwargs_to_cmd(kwargs)
 
             from model_navigator.framework_api.commands.correctness import correctness_script
 
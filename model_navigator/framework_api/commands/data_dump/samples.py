@@ -124,9 +124,10 @@ class FetchInputModelData(Command):
                         do_sample_profiling = True
 
             if do_sample_conversion:
-                conversion_samples.append(extract_bs1(sample, batch_dim))
-            if do_sample_profiling:
-                profiling_sample = extract_bs1(sample, batch_dim)
+                sample_bs1 = extract_bs1(sample, batch_dim)
+                conversion_samples.append(sample_bs1)
+                if do_sample_profiling:
+                    profiling_sample = sample_bs1
 
         if not conversion_samples:
             conversion_samples = correctness_samples[:1]
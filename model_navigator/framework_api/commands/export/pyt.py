@@ -78,7 +78,7 @@ class ExportPYT2TorchScript(ExportBase):
                 "navigator_workdir": workdir.as_posix(),
             }
 
-            args = parse_kwargs_to_cmd(kwargs, (list, dict, tuple))
+            args = parse_kwargs_to_cmd(kwargs)
 
             context.execute_local_runtime_script(
                 exporters.pytorch2torchscript.__file__, exporters.pytorch2torchscript.export, args
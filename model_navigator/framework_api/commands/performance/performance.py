@@ -347,7 +347,7 @@ class Performance(Command):
                 "runner_manager_dict": runner_manager.to_dict(parse=True),
             }
 
-            args = parse_kwargs_to_cmd(kwargs, (list, dict, tuple))
+            args = parse_kwargs_to_cmd(kwargs)
 
             from model_navigator.framework_api.commands.performance import performance_script
 
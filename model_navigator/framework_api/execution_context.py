@@ -15,6 +15,7 @@ import contextlib
 import copy
 import logging
 import os
+import shlex
 import shutil
 import subprocess
 import sys
@@ -135,13 +136,14 @@ class ExecutionContext(contextlib.AbstractContextManager):
             )
 
     def _bake_command(self, cmd):
-        LOGGER.info(f"Command: {' '.join(cmd)}")
+        cmd_str = shlex.join(cmd)
+        LOGGER.info(f"Command: {cmd_str}")
 
         if self._cmd_path is None:
             raise ValueError("cmd_path is required when using `execute_cmd` method.")
 
         with self._cmd_path.open("w") as f:
-            f.write(" ".join(cmd))
+            f.write(cmd_str)
 
         cmd_path_relative = self._cmd_path.relative_to(self._workdir)
         run_cmd = [os.environ.get("SHELL", "bash"), cmd_path_relative.as_posix()]
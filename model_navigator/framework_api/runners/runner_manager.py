@@ -88,17 +88,16 @@ class RunnerManager(DataObject):
                 runtime = [runtime]
             return OnnxrtRunner(SessionFromOnnx(model_path, providers=runtime))
         elif format == Format.TENSORRT:
-            from polygraphy.backend.common import BytesFromPath
             from polygraphy.backend.trt import EngineFromBytes
 
-            from model_navigator.framework_api.runners.trt import TrtRunner
+            from model_navigator.framework_api.runners.trt import MmapBytesFromPath, TrtRunner
 
             if runtime == RuntimeProvider.TRT_EXEC:
                 return TrtexecRunner(
                     model_path, Format.TENSORRT, runtime_config=TrtExecRuntimeConfig(tf32=True, use_cuda_graph=True)
                 )
             else:
-                return TrtRunner(EngineFromBytes(BytesFromPath(model_path)))
+                return TrtRunner(EngineFromBytes(MmapBytesFromPath(model_path)))
         elif format in (Format.TORCHSCRIPT, Format.TORCH_TRT):
             from model_navigator.framework_api.runners.pyt import PytRunner
 
@@ -13,6 +13,7 @@
 # limitations under the License.
 import dataclasses
 import json
+import mmap
 import subprocess
 import typing
 from collections import OrderedDict
@@ -44,6 +45,19 @@ class TrtRunner(INavigatorRunner, _TrtRunner):
         return super().infer(feed_dict, check_inputs, *args, **kwargs)
 
 
+class MmapBytesFromPath:
+    """
+    Memory-maps serialized engine instead of reading it into a bytes object.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def __call__(self) -> mmap.mmap:
+        with open(self.path, "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
 @dataclasses.dataclass
 class TrtExecRuntimeConfig:
     # see trtexec --help for meaning and default of below values
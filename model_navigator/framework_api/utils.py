@@ -11,9 +11,11 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Iterable, List, Mapping, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Sequence, Tuple
 
 import numpy
 from polygraphy.backend.trt import Profile
@@ -26,7 +28,8 @@ from model_navigator.utils import devices as devices_utils
 from model_navigator.utils import enums
 
 
-def get_supported_onnx_providers(exclude_trt: bool = False):
+@lru_cache
+def get_supported_onnx_providers(exclude_trt: bool = False) -> Tuple:
     gpu_available = bool(devices_utils.get_available_gpus())
     supported_providers = []
     if gpu_available:
@@ -34,20 +37,21 @@ def get_supported_onnx_providers(exclude_trt: bool = False):
     supported_providers.append(RuntimeProvider.CPU)
     if gpu_available and not exclude_trt:
         supported_providers.append(RuntimeProvider.TRT)
-    return supported_providers
+    return tuple(supported_providers)
 
 
-def get_available_onnx_providers(exclude_trt: bool = False) -> List:
+@lru_cache
+def get_available_onnx_providers(exclude_trt: bool = False) -> Tuple:
     import onnxruntime as onnxrt  # pytype: disable=import-error
 
     supported_providers = get_supported_onnx_providers(exclude_trt=exclude_trt)
     available_providers = onnxrt.get_available_providers()
-    onnx_providers = [prov for prov in supported_providers if prov in available_providers]
+    onnx_providers = tuple(prov for prov in supported_providers if prov in available_providers)
     return onnx_providers
 
 
-def numpy_to_torch_dtype(np_dtype):
-    np_dtype = numpy.dtype(np_dtype).type
+@lru_cache
+def _get_numpy_to_torch_dtype_map() -> Dict:
     import torch  # pytype: disable=import-error
 
     return {
@@ -62,7 +66,11 @@ def numpy_to_torch_dtype(np_dtype):
         numpy.float64: torch.float64,
         numpy.complex64: torch.complex64,
         numpy.complex128: torch.complex128,
-    }[np_dtype]
+    }
+
+
+def numpy_to_torch_dtype(np_dtype):
+    return _get_numpy_to_torch_dtype_map()[numpy.dtype(np_dtype).type]
 
 
 class Parameter(Enum):
@@ -83,6 +91,7 @@ class RuntimeProvider(str, Parameter):
     PYT = "PyTorchExecutionProvider"
 
 
+@lru_cache
 def format2runtimes(model_format: Format) -> Tuple:
     if model_format == Format.ONNX:
         return enums.parse(get_available_onnx_providers(), RuntimeProvider)
@@ -162,6 +171,7 @@ def to_numpy(tensor, from_framework: Framework):
 
 # pytype: disable=wrong-arg-types
 # pytype: disable=attribute-error
+@lru_cache
 def format_to_relative_model_path(
     format: Optional[Format] = None,
     jit_type: Optional[JitType] = None,
@@ -212,6 +222,8 @@ def sample_to_tuple(input: Any) -> Tuple[Any, ...]:
 
 
 def extract_sample(sample, input_metadata, framework: Framework) -> Sample:
+    if isinstance(sample, Mapping) and all(n in sample for n in input_metadata):
+        return {n: to_numpy(sample[n], framework) for n in input_metadata}
     sample = sample_to_tuple(sample)
     sample = {n: to_numpy(t, framework) for n, t in zip(input_metadata, sample)}
     return sample
@@ -223,17 +235,17 @@ def extract_bs1(sample: Sample, batch_dim: Optional[int]) -> Sample:
     return sample
 
 
+@lru_cache
 def get_framework_export_formats(framework: Framework):
     return {
-        Framework.PYT: {Format.TORCHSCRIPT, Format.ONNX},
-        Framework.TF2: {
-            Format.TF_SAVEDMODEL,
-        },
-        Framework.ONNX: {Format.ONNX},
-        Framework.JAX: {Format.TF_SAVEDMODEL},
+        Framework.PYT: frozenset({Format.TORCHSCRIPT, Format.ONNX}),
+        Framework.TF2: frozenset({Format.TF_SAVEDMODEL}),
+        Framework.ONNX: frozenset({Format.ONNX}),
+        Framework.JAX: frozenset({Format.TF_SAVEDMODEL}),
     }[framework]
 
 
+@lru_cache
 def get_base_format(format: Format, framework: Framework):
     return {
         Framework.PYT: {
@@ -254,17 +266,22 @@ def get_base_format(format: Format, framework: Framework):
     }[framework].get(format)
 
 
-def is_tensor(tensor, framework: Framework):
+@lru_cache
+def _get_framework_tensor_check(framework: Framework) -> Callable[[Any], bool]:
     if framework == Framework.PYT:
         import torch  # pytype: disable=import-error
 
-        return torch.is_tensor(tensor) or isinstance(tensor, numpy.ndarray)
+        return torch.is_tensor
     elif framework == Framework.TF2:
         import tensorflow  # pytype: disable=import-error
 
-        return tensorflow.is_tensor(tensor) or isinstance(tensor, numpy.ndarray)
+        return tensorflow.is_tensor
     else:
-        return isinstance(tensor, numpy.ndarray)
+        return lambda tensor: False
+
+
+def is_tensor(tensor, framework: Framework):
+    return _get_framework_tensor_check(framework)(tensor) or isinstance(tensor, numpy.ndarray)
 
 
 def get_tensor_type_name(framework: Framework):
@@ -280,15 +297,9 @@ def _is_valid_io(sample, framework):
     if is_tensor(sample, framework):
         return True
     if isinstance(sample, Mapping):
-        for tensor in sample.values():
-            if not is_tensor(tensor, framework):
-                return False
-        return True
+        return all(is_tensor(tensor, framework) for tensor in sample.values())
     elif isinstance(sample, Iterable):
-        for tensor in sample:
-            if not is_tensor(tensor, framework):
-                return False
-        return True
+        return all(is_tensor(tensor, framework) for tensor in sample)
     return False
 
 
@@ -310,22 +321,25 @@ def validate_sample_output(sample, framework: Framework):
         )
 
 
+def _load_sample(sample_filepath: Path, batch_dim: Optional[int]) -> Sample:
+    sample = {}
+    with numpy.load(sample_filepath.as_posix()) as data:
+        for k, v in data.items():
+            if batch_dim is not None:
+                v = numpy.expand_dims(v, batch_dim)
+                # v = numpy.repeat(v, max_batch_size, batch_dim)
+            sample[k] = v
+    return sample
+
+
 def load_samples(samples_name, workdir, batch_dim):
     if isinstance(workdir, str):
         workdir = Path(workdir)
     samples_type = samples_name.split("_")[0]
     samples_dirname = "model_output" if samples_name.split("_")[-1] == "output" else "model_input"
     samples_dirpath = workdir / samples_dirname / samples_type
-    samples = []
-    for sample_filepath in samples_dirpath.iterdir():
-        sample = {}
-        with numpy.load(sample_filepath.as_posix()) as data:
-            for k, v in data.items():
-                if batch_dim is not None:
-                    v = numpy.expand_dims(v, batch_dim)
-                    # v = numpy.repeat(v, max_batch_size, batch_dim)
-                sample[k] = v
-        samples.append(sample)
+    with ThreadPoolExecutor() as executor:
+        samples = list(executor.map(lambda path: _load_sample(path, batch_dim), samples_dirpath.iterdir()))
     if samples_type == "profiling":
         samples = samples[0]
 
@@ -338,15 +352,12 @@ def get_trt_profile_from_trt_dynamic_axes(trt_dynamic_axes):
         return trt_profile
     for name, axes in trt_dynamic_axes.items():
         if axes:
-            trt_profile.add(name, *list(zip(*list(axes.values()))))
+            trt_profile.add(name, *zip(*axes.values()))
     return trt_profile
 
 
-def parse_kwargs_to_cmd(kwargs, quote_wrap_classes=None):
-    if quote_wrap_classes is None:
-        quote_wrap_classes = ()
+def parse_kwargs_to_cmd(kwargs):
     args = []
     for k, v in kwargs.items():
-        s = str(v).replace("'", '"')
-        args.extend([f"--{k}", f"'{s}'" if isinstance(v, quote_wrap_classes) else s])
+        args.extend([f"--{k}", str(v)])
     return args
@@ -24,7 +24,7 @@ from polygraphy.backend.trt import Profile
 from model_navigator.__version__ import __version__
 from model_navigator.converter.config import TensorRTPrecision
 from model_navigator.framework_api.constants import NAV_PACKAGE_FORMAT_VERSION
-from model_navigator.framework_api.commands.convert.tf import ConvertSavedModel2TFTRT
+from model_navigator.framework_api.commands.convert.tf import ConvertSavedModel2ONNX, ConvertSavedModel2TFTRT
 from model_navigator.framework_api.commands.correctness import Correctness
 from model_navigator.framework_api.commands.data_dump.samples import (
     DumpInputModelData,
@@ -239,6 +239,33 @@ def test_tf2_export_savedmodel():
         tensorflow.keras.models.load_model(exported_model_path)
 
 
+def test_tf2_convert_onnx():
+    import onnx  # pytype: disable=import-error
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        model_name = "navigator_model"
+
+        workdir = Path(tmp_dir) / "navigator_workdir"
+
+        model_dir = workdir / "tf-savedmodel"
+        model_dir.mkdir(parents=True, exist_ok=True)
+        input_model_path = model_dir / "model.savedmodel"
+        tensorflow.keras.models.save_model(model=model, filepath=input_model_path, overwrite=True)
+
+        convert_cmd = ConvertSavedModel2ONNX()
+
+        converted_model_path = workdir / convert_cmd(
+            workdir=workdir,
+            opset=13,
+            model_name=model_name,
+            verbose=False,
+        )
+
+        onnx.checker.check_model(onnx.load(converted_model_path.as_posix()))
+        assert (converted_model_path.parent / "reproduce_conversion.py").is_file()
+        assert (converted_model_path.parent / "reproduce_conversion.sh").is_file()
+
+
 @pytest.mark.skipif(
     not CUDA_AVAILABLE,
     reason="GPU not available.",
@@ -270,3 +297,5 @@ def test_tf2_convert_tf_trt():
         )
 
         tensorflow.keras.models.load_model(converted_model_path)
+        assert (converted_model_path.parent / "reproduce_conversion.py").is_file()
+        assert (converted_model_path.parent / "reproduce_conversion.sh").is_file()
@@ -0,0 +1,97 @@
+# Copyright (c) 2021-2022, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import sys
+import tempfile
+import textwrap
+from pathlib import Path
+
+import fire
+import numpy
+
+from model_navigator.framework_api.execution_context import ExecutionContext
+from model_navigator.framework_api.utils import Framework, extract_sample, parse_kwargs_to_cmd
+
+CMD_KWARGS = {
+    "value_list": ["with space", "it's", 'say "hi"'],
+    "value_dict": {"key with space": "it's", "quoted": 'say "hi"', "number": 1, "empty": None},
+    "value_str": "it's a \"quoted\" string",
+    "value_int": 3,
+}
+
+
+def test_extract_sample_matches_mapping_by_input_name():
+    input_a = numpy.zeros((1, 3), dtype=numpy.float32)
+    input_b = numpy.ones((1, 5), dtype=numpy.int64)
+
+    sample = extract_sample({"b": input_b, "a": input_a}, ("a", "b"), Framework.ONNX)
+
+    assert list(sample.keys()) == ["a", "b"]
+    assert sample["a"] is input_a
+    assert sample["b"] is input_b
+
+
+def test_extract_sample_falls_back_to_position_for_unknown_mapping_keys():
+    input_0 = numpy.zeros((1, 3), dtype=numpy.float32)
+    input_1 = numpy.ones((1, 5), dtype=numpy.int64)
+
+    sample = extract_sample({"x": input_0, "y": input_1}, ("a", "b"), Framework.ONNX)
+
+    assert list(sample.keys()) == ["a", "b"]
+    assert sample["a"] is input_0
+    assert sample["b"] is input_1
+
+
+def test_parse_kwargs_to_cmd_round_trips_through_reproduction_script():
+    script = textwrap.dedent(
+        """
+        import json
+
+        import fire
+
+
+        def dump(results_path, value_list, value_dict, value_str, value_int):
+            with open(results_path, "w") as f:
+                json.dump(
+                    {"value_list": value_list, "value_dict": value_dict, "value_str": value_str, "value_int": value_int}, f
+                )
+
+
+        if __name__ == "__main__":
+            fire.Fire(dump)
+        """
+    )
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        workdir = Path(tmp_dir)
+        script_path = workdir / "dump.py"
+        script_path.write_text(script)
+        results_path = workdir / "results.json"
+
+        args = parse_kwargs_to_cmd({"results_path": results_path.as_posix(), **CMD_KWARGS})
+        with ExecutionContext(workdir=workdir, cmd_path=workdir / "reproduce.sh") as context:
+            context.execute_cmd([sys.executable, script_path.as_posix()] + args)
+
+        with results_path.open("r") as f:
+            assert json.load(f) == CMD_KWARGS
+
+
+def test_parse_kwargs_to_cmd_round_trips_through_fire():
+    parsed = {}
+
+    def dump(value_list, value_dict, value_str, value_int):
+        parsed.update(value_list=value_list, value_dict=value_dict, value_str=value_str, value_int=value_int)
+
+    fire.Fire(dump, parse_kwargs_to_cmd(CMD_KWARGS))
+
+    assert parsed == CMD_KWARGS